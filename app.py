@@ -9,28 +9,45 @@ run these commands in the terminal:
 
 Then open http://127.0.0.1:8050/ in a browser.
 
+Set APP_DEBUG=1 to enable Dash debug mode and the auto-reloader.
+
 The program will automatically shut down when you close the browser tab/window.
 You can also end the program manually by pressing ctrl+c in the terminal.
 """
 from __future__ import annotations
 import pathlib
+import queue
 import threading
 import time
 import sys
 import os
+import tempfile
+from functools import lru_cache
 
 import dash
-from dash import Dash, html, dcc, Input, Output, ClientsideFunction
+from dash import Dash, html, dcc, Input, Output, State, Patch, ClientsideFunction
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from flask_compress import Compress
+
+try:
+    import pyarrow  # faster CSV parser and the Feather cache; the app still runs without it
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Serialise figures with orjson (C extension) rather than the pure-Python encoder
+pio.json.config.default_engine = "orjson"
 
 # -----------------------------------------------------------------------------
 # Load data
 # -----------------------------------------------------------------------------
 THIS_DIR = pathlib.Path(__file__).resolve().parent
 DATA_PATH = THIS_DIR / "data" / "dataset.csv"
-
-df = pd.read_csv(DATA_PATH)
+CACHE_PATH = THIS_DIR / "data" / "dataset.feather"  # parsed copy of DATA_PATH
 
 NUMERIC_COLS = [
     "danceability",
@@ -60,59 +77,293 @@ metric_labels = {
     "popularity": "Popularity (0‑100)",
 }
 
+# Only the columns used by the app are read. Features are bounded, so 32-bit
+# floats lose nothing visible; categoricals make genre lookups and track
+# de-duplication work on integer codes.
+REQUIRED_COLS = NUMERIC_COLS + ["track_genre", "track_name", "artists", "explicit"]
+SCHEMA = {
+    **{c: "float32" for c in NUMERIC_COLS if c not in ("duration_ms", "popularity")},
+    "duration_ms": "int32",
+    "popularity": "int16",
+    "explicit": "bool",
+    "track_genre": "category",
+    "track_name": "category",
+    "artists": "category",
+}
+
+
+def load_dataset() -> pd.DataFrame:
+    """Load the dataset, reusing the Feather cache while it is newer than the CSV."""
+    if HAS_PYARROW and CACHE_PATH.exists() and CACHE_PATH.stat().st_mtime >= DATA_PATH.stat().st_mtime:
+        try:
+            cached = pd.read_feather(CACHE_PATH)
+        except (OSError, pyarrow.ArrowInvalid) as e:
+            print(f"Ignoring unreadable dataset cache {CACHE_PATH}: {e}")
+        else:
+            # Rebuild the cache if it was written with a different schema
+            if list(cached.columns) == REQUIRED_COLS and all(str(cached[c].dtype) == t for c, t in SCHEMA.items()):
+                return cached
+
+    data = pd.read_csv(DATA_PATH, engine="pyarrow" if HAS_PYARROW else "c", usecols=REQUIRED_COLS, dtype=SCHEMA)
+    data = data[REQUIRED_COLS]
+    if HAS_PYARROW:
+        # Write to a temporary file and move it into place, so an interrupted
+        # or concurrent write never leaves a truncated cache behind
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=CACHE_PATH.parent, prefix=CACHE_PATH.name, suffix=".tmp", delete=False) as tmp:
+                tmp_path = tmp.name
+                data.to_feather(tmp)
+            os.replace(tmp_path, CACHE_PATH)
+        except OSError as e:
+            print(f"Could not write dataset cache {CACHE_PATH}: {e}")
+            if tmp_path is not None:
+                pathlib.Path(tmp_path).unlink(missing_ok=True)
+    return data
+
+
+df = load_dataset()
+
+# Contiguous arrays for the filter columns, so masks are built in NumPy
+GENRE_TO_CODE = {g: i for i, g in enumerate(df.track_genre.cat.categories)}
+_genre_codes = np.ascontiguousarray(df.track_genre.cat.codes.to_numpy())
+_pop = np.ascontiguousarray(df["popularity"].to_numpy())
+_explicit = np.ascontiguousarray(df["explicit"].to_numpy(dtype=bool))
+
+# Inverted index of the row positions of every genre, so filtering only
+# touches the selected genres. One stable sort groups the rows by genre code
+# (in dataset order), instead of a full scan per genre.
+_rows_by_genre = np.argsort(_genre_codes, kind="stable")
+_genre_bounds = np.cumsum(np.bincount(_genre_codes, minlength=len(GENRE_TO_CODE)))[:-1]
+GENRE_ROWS: dict[str, np.ndarray] = dict(zip(GENRE_TO_CODE, np.split(_rows_by_genre, _genre_bounds)))
+
+# Control options, built once (categories are already unique and sorted)
+GENRE_OPTIONS = [{"label": g.capitalize(), "value": g} for g in df.track_genre.cat.categories]
+DEFAULT_GENRES = ["pop", "rock"] if "pop" in GENRE_TO_CODE else list(df.track_genre.cat.categories[:3])
+METRIC_OPTIONS = [{"label": metric_labels[c], "value": c} for c in NUMERIC_COLS]
+
+
+@lru_cache(maxsize=64)
+def _filter_rows(genres: tuple[str, ...], pop_lo: int, pop_hi: int, explicit_filter: str) -> np.ndarray:
+    """Return the positions of the rows matching the controls, in dataset order."""
+    rows = [GENRE_ROWS[g] for g in genres if g in GENRE_ROWS]
+    idx = np.sort(np.concatenate(rows)) if rows else np.empty(0, dtype=np.intp)
+    pop_sub = _pop[idx]
+    mask = (pop_sub >= pop_lo) & (pop_sub <= pop_hi)
+    if explicit_filter == "non":
+        mask &= ~_explicit[idx]
+    elif explicit_filter == "explicit":
+        mask &= _explicit[idx]
+    return idx[mask]
+
+
+@lru_cache(maxsize=64)
+def _filter(genres: tuple[str, ...], pop_lo: int, pop_hi: int, explicit_filter: str) -> pd.DataFrame:
+    """Return the rows matching the controls; cached so axis-only changes skip filtering."""
+    return df.take(_filter_rows(genres, pop_lo, pop_hi, explicit_filter))
+
+
+MAX_PLOT_POINTS = 3000  # cap on the rows drawn as individual markers
+
+
+def _subsample(dff: pd.DataFrame, n: int = MAX_PLOT_POINTS) -> pd.DataFrame:
+    """Randomly sample about ``n`` rows, keeping each genre's share of the rows.
+
+    Every genre with matching rows keeps at least one, so no genre drops out
+    of the scatter legend while still appearing in the box plot.
+    """
+    if len(dff) <= n:
+        return dff
+    frac = n / len(dff)
+    sample = pd.concat(
+        group.sample(max(1, round(frac * len(group))), random_state=0)
+        for _, group in dff.groupby("track_genre", observed=True)
+    )
+    return sample.sort_index()
+
+
+@lru_cache(maxsize=64)
+def _plot_sample(genres: tuple[str, ...], pop_lo: int, pop_hi: int, explicit_filter: str) -> pd.DataFrame:
+    """Cached sample of the filtered rows, so axis-only updates reuse the same points."""
+    return _subsample(_filter(genres, pop_lo, pop_hi, explicit_filter))
+
+
+# Axis-dependent strings are pure functions of the chosen metrics, so each is
+# built once per metric (pair) and reused by both figure callbacks
+@lru_cache(maxsize=len(NUMERIC_COLS) ** 2)
+def _scatter_title(x_col: str, y_col: str) -> str:
+    return f"{metric_labels[x_col]} vs {metric_labels[y_col]}"
+
+
+@lru_cache(maxsize=len(NUMERIC_COLS) ** 2)
+def _scatter_hovertemplate(x_col: str, y_col: str) -> str:
+    return (
+        f"Genre=%{{fullData.name}}<br>{metric_labels[x_col]}=%{{x}}<br>{metric_labels[y_col]}=%{{y}}<br>"
+        "Track=%{customdata[0]}<br>Artists=%{customdata[1]}<br>Popularity=%{customdata[2]}<extra></extra>"
+    )
+
+
+def _top_tracks(rows: np.ndarray, n: int = 10, candidates: int = 50) -> pd.DataFrame:
+    """Return the ``n`` most popular unique tracks among ``rows``, least popular first."""
+    # Drop duplicates to ensure each song appears only once, keeping each
+    # song's most popular copy. Only the top candidates are de-duplicated:
+    # a linear-time partition finds the popularity of the 50th row, and every
+    # row at or above it (ties included, as nlargest would rank them) is kept.
+    # If they hold fewer than n unique songs, all rows are used instead.
+    pop_sub = _pop[rows]
+    top_rows = rows
+    if candidates < len(rows):
+        kth = np.partition(pop_sub, len(rows) - candidates)[len(rows) - candidates]
+        top_rows = rows[pop_sub >= kth]
+    ranked = df.take(top_rows).sort_values("popularity", ascending=False, kind="stable")
+    unique_tracks = ranked.drop_duplicates(subset=["track_name", "artists"])
+    if len(unique_tracks) < n and len(top_rows) < len(rows):
+        ranked = df.take(rows).sort_values("popularity", ascending=False, kind="stable")
+        unique_tracks = ranked.drop_duplicates(subset=["track_name", "artists"])
+    return unique_tracks.head(n).sort_values("popularity", ascending=True)
+
+
+def _box_data(dff: pd.DataFrame, sample: pd.DataFrame, y_col: str) -> dict:
+    """Return ``go.Box`` arguments with precomputed per-genre quartiles and whiskers.
+
+    The statistics use every filtered row; the outlier points drawn beyond the
+    whiskers come from the plotted sample, keeping the payload bounded.
+    """
+    sampled = {genre: values.to_numpy() for genre, values in sample.groupby("track_genre", observed=True)[y_col]}
+    genres, stats, outliers = [], [], []
+    for genre, values in dff.groupby("track_genre", observed=True, sort=False)[y_col]:
+        v = values.to_numpy()
+        # Hazen quartiles match plotly's default quartilemethod="linear"
+        q1, median, q3 = np.percentile(v, [25, 50, 75], method="hazen")
+        # Whiskers end at the furthest values within 1.5 IQR, as plotly computes them
+        inside = v[(v >= q1 - 1.5 * (q3 - q1)) & (v <= q3 + 1.5 * (q3 - q1))]
+        lower, upper = inside.min(), inside.max()
+        points = sampled.get(genre, v[:0])
+        genres.append(genre)
+        stats.append((q1, median, q3, lower, upper))
+        outliers.append(points[(points < lower) | (points > upper)].tolist())
+    # Cast the statistics to plain floats once for all genres
+    q1s, medians, q3s, lowers, uppers = np.asarray(stats, dtype=np.float64).reshape(-1, 5).T.tolist()
+    return {
+        "x": genres,
+        "q1": q1s,
+        "median": medians,
+        "q3": q3s,
+        "lowerfence": lowers,
+        "upperfence": uppers,
+        "y": outliers,
+    }
+
+
+@lru_cache(maxsize=len(NUMERIC_COLS))
+def _box_title(y_col: str) -> str:
+    return f"Distribution of {metric_labels[y_col]} by Genre"
+
+
+@lru_cache(maxsize=len(NUMERIC_COLS))
+def _box_hovertemplate(y_col: str) -> str:
+    return f"Genre=%{{x}}<br>{metric_labels[y_col]}=%{{y}}<extra></extra>"
+
 # -----------------------------------------------------------------------------
 # Build Dash app
 # -----------------------------------------------------------------------------
 app: Dash = dash.Dash(__name__)
 app.title = "Spotify Audio Explorer"
 
-# Track active connections
-active_connections = set()
-connection_last_ping = {}  # Store the last ping time for each connection
-connection_lock = threading.Lock()
-
-# Function to monitor connections and shut down server when all are closed
-def monitor_connections():
-    # Give time for initial connection
-    startup_time = time.time()
-    startup_grace_period = 60  # seconds
-    connection_timeout = 300  # seconds - how long to wait before considering a connection stale
-
-    had_connections = False
+# Compress responses (mostly figure JSON); level 4 balances latency and size
+app.server.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.server.config["COMPRESS_LEVEL"] = 4
+app.server.config["COMPRESS_BR_LEVEL"] = 4
+Compress(app.server)
+
+# Track active connections: connection id -> time of its last ping. Only the
+# connection-events thread (below) reads or writes it, so no lock is needed.
+connection_last_ping: dict[str, float] = {}
+
+startup_time = time.time()
+startup_grace_period = 60  # seconds - never shut down before this
+connection_timeout = 300  # seconds - how long to wait before considering a connection stale
+disconnect_delay = 2  # seconds - lets a page reload reconnect before shutting down
+
+# Single timer that checks for idleness; armed by the first connection and
+# re-armed by each check, so the server wakes up once per timeout, not every
+# few seconds. It is only armed from the connection-events thread.
+idle_timer: threading.Timer | None = None
+
+def arm_idle_timer(delay: float):
+    """(Re)start the idle timer, never firing inside the startup grace period."""
+    global idle_timer
+    if idle_timer is not None:
+        idle_timer.cancel()
+    delay = max(delay, startup_time + startup_grace_period - time.time())
+    # The timer only queues an idle check for the connection-events thread;
+    # its name marks the check so one from a replaced timer can be ignored
+    idle_timer = threading.Timer(delay, connection_events.put)
+    idle_timer.args = (('idle-check', idle_timer.name, time.time()),)
+    idle_timer.daemon = True
+    idle_timer.start()
+
+# Shut down the server when all connections are closed or stale
+# (runs on the connection-events thread)
+def check_idle():
+    current_time = time.time()
 
+    # Remove stale connections
+    for conn_id, last_ping in connection_last_ping.copy().items():
+        if current_time - last_ping > connection_timeout:
+            connection_last_ping.pop(conn_id, None)
+            print(f"Removed stale connection: {conn_id}. Active connections: {len(connection_last_ping)}")
+
+    remaining = connection_last_ping.copy()
+    if remaining:
+        # Check again when the most recently seen connection would go stale
+        arm_idle_timer(connection_timeout - (current_time - max(remaining.values())))
+    else:
+        print("All connections closed. Shutting down server...")
+        os._exit(0)  # Force exit the process
+
+# Connection status updates (and idle checks from the timer) are queued and
+# applied by a single worker thread, so request threads never wait on
+# bookkeeping or logging, and connection state has a single writer
+connection_events: queue.SimpleQueue = queue.SimpleQueue()
+
+def record_connection_event(status: str | None, connection_id: str | None, event_time: float):
+    """Apply one connection status update to connection_last_ping."""
+    if status == 'connected' and connection_id:
+        connection_last_ping[connection_id] = event_time
+        print(f"New connection: {connection_id}. Active connections: {len(connection_last_ping)}")
+    elif status == 'disconnected' and connection_id:
+        if connection_last_ping.pop(connection_id, None) is not None:
+            print(f"Connection closed: {connection_id}. Active connections: {len(connection_last_ping)}")
+        if not connection_last_ping:
+            arm_idle_timer(disconnect_delay)
+    elif status == 'ping' and connection_id:
+        # This is just a heartbeat to keep the connection alive
+        if connection_id not in connection_last_ping:
+            print(f"Reconnected via ping: {connection_id}. Active connections: {len(connection_last_ping) + 1}")
+        connection_last_ping[connection_id] = event_time
+    elif status == 'hidden' and connection_id:
+        # Page is hidden but not necessarily closed
+        # We'll keep the connection active but log it
+        connection_last_ping[connection_id] = event_time
+        print(f"Connection hidden: {connection_id}. Active connections: {len(connection_last_ping)}")
+    elif status == 'idle-check':
+        if idle_timer is not None and connection_id == idle_timer.name:
+            check_idle()
+    else:
+        print(f"Unhandled connection status: {status} for ID: {connection_id}")
+
+    # The first connection arms the idle timer; after that it re-arms itself
+    if connection_last_ping and idle_timer is None:
+        arm_idle_timer(connection_timeout)
+
+def process_connection_events():
     while True:
-        time.sleep(2)  # Check every 2 seconds
-
-        # Skip checking during startup grace period
-        if time.time() - startup_time < startup_grace_period:
-            continue
-
-        current_time = time.time()
-
-        with connection_lock:
-            # Check for stale connections
-            stale_connections = []
-            for conn_id in active_connections:
-                last_ping = connection_last_ping.get(conn_id, 0)
-                if last_ping > 0 and current_time - last_ping > connection_timeout:
-                    stale_connections.append(conn_id)
-
-            # Remove stale connections
-            for conn_id in stale_connections:
-                active_connections.remove(conn_id)
-                connection_last_ping.pop(conn_id, None)
-                print(f"Removed stale connection: {conn_id}. Active connections: {len(active_connections)}")
-
-            # Only shut down if we had connections before and now have none
-            if active_connections:
-                had_connections = True
-            elif had_connections:
-                print("All connections closed. Shutting down server...")
-                os._exit(0)  # Force exit the process
-
-# Start the monitoring thread
-monitor_thread = threading.Thread(target=monitor_connections, daemon=True)
-monitor_thread.start()
+        record_connection_event(*connection_events.get())
+
+# Start the connection-events thread
+events_thread = threading.Thread(target=process_connection_events, daemon=True)
+events_thread.start()
 
 # Add client-side callback to detect page load/unload
 app.clientside_callback(
@@ -258,8 +509,8 @@ app.layout = html.Div(
                         html.Label("Genre(s)"),
                         dcc.Dropdown(
                             id="genreDropdown",
-                            options=[{"label": g.capitalize(), "value": g} for g in sorted(df.track_genre.unique())],
-                            value=["pop", "rock"] if "pop" in df.track_genre.values else sorted(df.track_genre.unique())[:3],
+                            options=GENRE_OPTIONS,
+                            value=DEFAULT_GENRES,
                             multi=True,
                         ),
                         html.Br(),
@@ -271,6 +522,8 @@ app.layout = html.Div(
                             step=1,
                             value=[20, 80],
                             marks={0: "0", 50: "50", 100: "100"},
+                            # Filter only once the handle is released, not on every drag step
+                            updatemode="mouseup",
                         ),
                         html.Br(),
                         html.Label("Explicit?"),
@@ -287,7 +540,7 @@ app.layout = html.Div(
                         html.Label("X‑axis metric"),
                         dcc.Dropdown(
                             id="xMetric",
-                            options=[{"label": metric_labels[c], "value": c} for c in NUMERIC_COLS],
+                            options=METRIC_OPTIONS,
                             value="danceability",
                             clearable=False,
                         ),
@@ -295,7 +548,7 @@ app.layout = html.Div(
                         html.Label("Y‑axis metric"),
                         dcc.Dropdown(
                             id="yMetric",
-                            options=[{"label": metric_labels[c], "value": c} for c in NUMERIC_COLS],
+                            options=METRIC_OPTIONS,
                             value="energy",
                             clearable=False,
                         ),
@@ -306,9 +559,16 @@ app.layout = html.Div(
                 # ─── Graphs column ────────────────────────────────────────────
                 html.Div(
                     [
-                        dcc.Graph(id="scatterPlot"),
-                        dcc.Graph(id="boxPlot"),
-                        dcc.Graph(id="barPlot"),
+                        # One spinner per graph, so a Patch that skips the bar chart
+                        # leaves it alone; graphs stay visible (dimmed) while loading
+                        # and quick updates show no spinner at all
+                        dcc.Loading(
+                            dcc.Graph(id=graph_id),
+                            type="default",
+                            overlay_style={"visibility": "visible", "opacity": 0.5},
+                            delay_show=300,
+                        )
+                        for graph_id in ("scatterPlot", "boxPlot", "barPlot")
                     ],
                     style={"width": "74%", "display": "inline-block"},
                 ),
@@ -328,91 +588,60 @@ app.layout = html.Div(
     prevent_initial_call=True
 )
 def handle_connection_status(data):
-    """Track connection status and update the active_connections set."""
+    """Queue the connection status update for the connection-events thread."""
     if not data:
         print("Warning: Received empty data in handle_connection_status")
         return dash.no_update
 
-    connection_id = data.get('id')
-    status = data.get('status')
-
-    print(f"Connection status update received: {status} - {connection_id}")
-
-    current_time = time.time()
-
-    with connection_lock:
-        if status == 'connected' and connection_id:
-            active_connections.add(connection_id)
-            connection_last_ping[connection_id] = current_time
-            print(f"New connection: {connection_id}. Active connections: {len(active_connections)}")
-        elif status == 'disconnected' and connection_id in active_connections:
-            active_connections.remove(connection_id)
-            connection_last_ping.pop(connection_id, None)
-            print(f"Connection closed: {connection_id}. Active connections: {len(active_connections)}")
-        elif status == 'ping' and connection_id:
-            # Update the last ping time for this connection
-            connection_last_ping[connection_id] = current_time
-            # This is just a heartbeat to keep the connection alive
-            if connection_id not in active_connections:
-                active_connections.add(connection_id)
-                print(f"Reconnected via ping: {connection_id}. Active connections: {len(active_connections)}")
-            # Otherwise, connection is already tracked, no need to log
-        elif status == 'hidden' and connection_id:
-            # Page is hidden but not necessarily closed
-            # We'll keep the connection active but log it
-            connection_last_ping[connection_id] = current_time
-            if connection_id not in active_connections:
-                active_connections.add(connection_id)
-            print(f"Connection hidden: {connection_id}. Active connections: {len(active_connections)}")
-        else:
-            print(f"Unhandled connection status: {status} for ID: {connection_id}")
+    connection_events.put((data.get('status'), data.get('id'), time.time()))
 
     return dash.no_update
 
-@app.callback(
-    Output("scatterPlot", "figure"),
-    Output("boxPlot", "figure"),
-    Output("barPlot", "figure"),
-    Input("genreDropdown", "value"),
-    Input("popSlider", "value"),
-    Input("explicitRadio", "value"),
-    Input("xMetric", "value"),
-    Input("yMetric", "value"),
-)
-def update_figures(genres: list[str], pop_range: list[int], explicit_filter: str, x_col: str, y_col: str):
-    """Return three Plotly figures based on current filters."""
+@lru_cache(maxsize=32)
+def _make_figs(genres: tuple[str, ...], pop_lo: int, pop_hi: int, explicit_filter: str, x_col: str, y_col: str):
+    """Build the three figures; cached so clients with the same controls share them."""
     # Filter dataframe -----------------------------------------------------
-    dff = df[df.track_genre.isin(genres) & (df.popularity.between(pop_range[0], pop_range[1]))]
-    if explicit_filter == "non":
-        dff = dff[~dff["explicit"]]
-    elif explicit_filter == "explicit":
-        dff = dff[dff["explicit"]]
+    key = (genres, pop_lo, pop_hi, explicit_filter)
+    dff = _filter(*key)
+    # Scatter and box points are drawn from a sample; the bar chart uses every row
+    sample = _plot_sample(*key)
 
     # Scatter plot ---------------------------------------------------------
-    scatter = px.scatter(
-        dff,
-        x=x_col,
-        y=y_col,
-        color="track_genre",
-        hover_data=["track_name", "artists", "popularity"],
-        labels={x_col: metric_labels[x_col], y_col: metric_labels[y_col], "track_genre": "Genre"},
-        title=f"{metric_labels[x_col]} vs {metric_labels[y_col]} ({len(dff)} tracks)",
+    # One WebGL trace per genre, built directly from the sampled arrays
+    scatter = go.Figure(
+        [
+            go.Scattergl(
+                x=group[x_col].to_numpy(),
+                y=group[y_col].to_numpy(),
+                customdata=group[["track_name", "artists", "popularity"]].to_numpy(),
+                name=genre,
+                legendgroup=genre,
+                mode="markers",
+                hovertemplate=_scatter_hovertemplate(x_col, y_col),
+            )
+            for genre, group in sample.groupby("track_genre", observed=True, sort=False)
+        ]
+    )
+    scatter.update_layout(
+        title=f"{_scatter_title(x_col, y_col)} ({len(dff)} tracks)",
+        xaxis_title=metric_labels[x_col],
+        yaxis_title=metric_labels[y_col],
+        legend_title_text="Genre",
     )
 
     # Box plot -------------------------------------------------------------
-    box = px.box(
-        dff,
-        x="track_genre",
-        y=y_col,
-        points="all",
-        labels={"track_genre": "Genre", y_col: metric_labels[y_col]},
-        title=f"Distribution of {metric_labels[y_col]} by Genre",
+    # Quartiles are computed here, so only the summaries and outliers are sent
+    box = go.Figure(
+        go.Box(**_box_data(dff, sample, y_col), boxpoints="outliers", hovertemplate=_box_hovertemplate(y_col))
+    )
+    box.update_layout(
+        title=_box_title(y_col),
+        xaxis_title="Genre",
+        yaxis_title=metric_labels[y_col],
     )
 
     # Bar chart ------------------------------------------------------------
-    # Drop duplicates to ensure each song appears only once
-    unique_tracks = dff.drop_duplicates(subset=["track_name", "artists"])
-    bar_df = unique_tracks.nlargest(10, "popularity").sort_values("popularity", ascending=True)
+    bar_df = _top_tracks(_filter_rows(*key))
     bar = px.bar(
         bar_df,
         x="popularity",
@@ -426,8 +655,63 @@ def update_figures(genres: list[str], pop_range: list[int], explicit_filter: str
     return scatter, box, bar
 
 
+@app.callback(
+    Output("scatterPlot", "figure"),
+    Output("boxPlot", "figure"),
+    Output("barPlot", "figure"),
+    Input("genreDropdown", "value"),
+    Input("popSlider", "value"),
+    Input("explicitRadio", "value"),
+    State("xMetric", "value"),
+    State("yMetric", "value"),
+)
+def update_figures(genres: list[str], pop_range: list[int], explicit_filter: str, x_col: str, y_col: str):
+    """Return three Plotly figures based on current filters."""
+    return _make_figs(tuple(sorted(genres or [])), pop_range[0], pop_range[1], explicit_filter, x_col, y_col)
+
+
+@app.callback(
+    Output("scatterPlot", "figure", allow_duplicate=True),
+    Output("boxPlot", "figure", allow_duplicate=True),
+    Input("xMetric", "value"),
+    Input("yMetric", "value"),
+    State("genreDropdown", "value"),
+    State("popSlider", "value"),
+    State("explicitRadio", "value"),
+    prevent_initial_call=True,
+)
+def update_axes(x_col: str, y_col: str, genres: list[str], pop_range: list[int], explicit_filter: str):
+    """Swap the plotted metrics by patching the existing figures' data and labels."""
+    key = (tuple(sorted(genres or [])), pop_range[0], pop_range[1], explicit_filter)
+    dff = _filter(*key)
+    sample = _plot_sample(*key)
+
+    # Scatter plot: one trace per genre, in the order update_figures created them
+    scatter = Patch()
+    hovertemplate = _scatter_hovertemplate(x_col, y_col)
+    for i, (_, group) in enumerate(sample.groupby("track_genre", observed=True, sort=False)):
+        scatter["data"][i]["x"] = group[x_col].to_numpy()
+        scatter["data"][i]["y"] = group[y_col].to_numpy()
+        scatter["data"][i]["hovertemplate"] = hovertemplate
+    scatter["layout"]["xaxis"]["title"]["text"] = metric_labels[x_col]
+    scatter["layout"]["yaxis"]["title"]["text"] = metric_labels[y_col]
+    scatter["layout"]["title"]["text"] = f"{_scatter_title(x_col, y_col)} ({len(dff)} tracks)"
+
+    # Box plot: a single trace holding every genre
+    box = Patch()
+    for prop, value in _box_data(dff, sample, y_col).items():
+        box["data"][0][prop] = value
+    box["data"][0]["hovertemplate"] = _box_hovertemplate(y_col)
+    box["layout"]["yaxis"]["title"]["text"] = metric_labels[y_col]
+    box["layout"]["title"]["text"] = _box_title(y_col)
+
+    return scatter, box
+
+
 # -----------------------------------------------------------------------------
 # Main
 # -----------------------------------------------------------------------------
 if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=8050)
+    # Debug mode (dev tools and the reloader, which loads the data twice) is opt-in
+    debug = os.environ.get("APP_DEBUG") == "1"
+    app.run(debug=debug, host="0.0.0.0", port=8050, use_reloader=debug)